@@ -1,10 +1,17 @@
 import os
+import asyncio
 import json
 import sqlite3
 import random
+import re
+import bisect
 import logging
-import shutil
-from datetime import datetime, UTC, timedelta
+import threading
+import time
+from datetime import datetime, UTC
+from functools import lru_cache
+from typing import Optional
+from zoneinfo import ZoneInfo
 import discord
 from discord import app_commands
 from discord.ext import commands
@@ -14,35 +21,114 @@ CHANNEL_ID = int(os.getenv("DISCORD_CHANNEL_ID"))
 DISCORD_SERVER_ID = int(os.getenv("DISCORD_SERVER_ID"))
 DISCORD_APP_ID = int(os.getenv("DISCORD_APP_ID"))
 
+# /setdeadline takes times in US Central time (CST in winter, CDT in summer)
+CENTRAL_TZ = ZoneInfo("America/Chicago")
+# Shape of deadline input (/setdeadline and DeadlineModal), checked before parsing so typos are rejected
+_DEADLINE_RE = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}")
+
 async def send_startup_message(bot):
     # Try cache first, then API fetch if needed
     channel = bot.get_channel(CHANNEL_ID) or await bot.fetch_channel(CHANNEL_ID)
     await channel.send("Bot is now online in this channel!")
 
 # ---------- Tasks ----------
-# The update_countdown task runs every X minutes to check if there is an active entry deadline and updates a countdown message in the configured channel with the time remaining until the deadline. If the deadline has passed, it updates the message to indicate that entries are closed. This allows participants to see how much time they have left to enter the contest and creates a sense of urgency as the deadline approaches.
-@tasks.loop(minutes=60)  # Update every 60 minutes
-async def update_countdown():
-    """Background task to update countdown message"""
+# The update_countdown task checks if there is an active entry deadline and updates a countdown message in the configured channel with the time remaining until the deadline. If the deadline has passed, it updates the message to indicate that entries are closed. This allows participants to see how much time they have left to enter the contest and creates a sense of urgency as the deadline approaches.
+# The interval adapts each tick by how much time is left (see COUNTDOWN_INTERVAL_TIERS), and is every few hours when there is no deadline at all.
+# Wake-ups are aligned to the moment the displayed minutes change instead of polling on a fixed clock.
+COUNTDOWN_IDLE_INTERVAL = 6 * 3600  # seconds between ticks when no deadline is active
+
+# (time left above this many seconds, whole minutes between refreshes), checked in order.
+# Each step above the final tier is no longer than its threshold, so a sleep never skips past the next tier;
+# the final tier's 1-minute step is instead capped by the deadline itself (see next_countdown_interval).
+# The embed shows whole minutes (and <t:...:R> ticks live in the client), so 1 minute is the floor.
+COUNTDOWN_INTERVAL_TIERS = (
+    (86400, 60),  # More than a day left: hourly
+    (3600, 10),   # More than an hour: every 10 minutes
+    (0, 1),       # Final hour: every minute
+)
+
+def next_countdown_interval(remaining: float) -> float:
+    """Seconds to sleep before the next countdown refresh, given seconds left until the deadline."""
+    if remaining <= 0:
+        return COUNTDOWN_IDLE_INTERVAL
+    minutes = next(step for threshold, step in COUNTDOWN_INTERVAL_TIERS if remaining > threshold)
+    # Wake just after a minute boundary, so the refreshed embed already shows the new value
+    # (and the last sleep lands right after the deadline itself)
+    return remaining % 60 + 60 * (minutes - 1) + 0.5
+
+# Signature of the last countdown embed we sent, so unchanged ticks skip the Discord edit
+_last_countdown_sig: tuple | None = None
+
+def build_countdown_embed(contest_id: int, deadline_dt: datetime, now: datetime) -> tuple[discord.Embed, tuple]:
+    """Build the public countdown embed, plus a signature of what it displays."""
+    # Calculate time remaining
+    time_remaining = deadline_dt - now
+    days = time_remaining.days
+    hours, remainder = divmod(time_remaining.seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    
+    embed = discord.Embed(
+        title=f"⏰ Contest #{contest_id} Countdown",
+        description=f"Time remaining until entry deadline:",
+        color=0x00FFAA,
+    )
+    
+    countdown_text = []
+    if days > 0:
+        countdown_text.append(f"**{days}** day{'s' if days != 1 else ''}")
+    if hours > 0 or days > 0:
+        countdown_text.append(f"**{hours}** hour{'s' if hours != 1 else ''}")
+    countdown_text.append(f"**{minutes}** minute{'s' if minutes != 1 else ''}")
+    
+    embed.add_field(
+        name="Time Remaining",
+        value=" ".join(countdown_text),
+        inline=False,
+    )
+    
+    discord_timestamp = int(deadline_dt.timestamp())
+    
+    embed.add_field(
+        name="Deadline",
+        value=f"<t:{discord_timestamp}:F> (<t:{discord_timestamp}:R>)",
+        inline=False,
+    )
+    
+    embed.set_footer(text="Use /enter to submit your guess!")
+    return embed, (contest_id, discord_timestamp, days, hours, minutes)
+
+# Set when the deadline changes, to wake update_countdown before its current wait runs out
+_countdown_wake = asyncio.Event()
+
+async def refresh_countdown() -> float:
+    """Update the countdown message once, returning the seconds to wait before the next refresh."""
+    global _last_countdown_sig
+    next_interval = COUNTDOWN_IDLE_INTERVAL
     try:
-        deadline = get_entry_deadline()
+        settings = get_settings_bulk(
+            ("entry_deadline", "countdown_channel_id", "countdown_message_id", "current_contest_id")
+        )
+        deadline = settings.get("entry_deadline")
         if not deadline:
-            return  # No deadline set
-        
+            return next_interval  # No deadline set
+    
+        deadline_dt = parse_entry_deadline(deadline)
+        now = datetime.now(UTC)
+        if now < deadline_dt:
+            # Wake more often as the deadline gets closer, aligned to when the display changes
+            next_interval = next_countdown_interval((deadline_dt - now).total_seconds())
+
         # Prefer configured countdown channel; fall back to default CHANNEL_ID
-        channel_id = get_countdown_channel_id() or CHANNEL_ID
-        message_id = get_countdown_message_id()    
-       
+        channel_id = int(settings.get("countdown_channel_id") or CHANNEL_ID)
+        message_id = int(settings["countdown_message_id"]) if "countdown_message_id" in settings else None
+   
         if not channel_id:
-            return  # No channel configured
-        
+            return next_interval  # No channel configured
+    
         channel = bot.get_channel(channel_id)
         if not channel:
-            return
-        
-        deadline_dt = datetime.fromisoformat(deadline)
-        now = datetime.now(UTC)
-        
+            return next_interval
+    
         # If deadline passed, stop countdown
         if now >= deadline_dt:
             if message_id:
@@ -54,64 +140,45 @@ async def update_countdown():
                         color=0xFF0000,  # Red
                     )
                     await message.edit(embed=embed)
-                    set_countdown_message_id(None)  # Clear message ID
+                    await adb(set_countdown_message_id, None)  # Clear message ID
                 except discord.HTTPException as e:
                     log.warning("Failed to update final countdown message %s: %s", message_id, e)
-            return
-        
-        # Calculate time remaining
-        time_remaining = deadline_dt - now
-        days = time_remaining.days
-        hours, remainder = divmod(time_remaining.seconds, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        
+            return next_interval
+    
         # Create countdown embed
-        contest_id = get_current_contest_id()
-        embed = discord.Embed(
-            title=f"⏰ Contest #{contest_id} Countdown",
-            description=f"Time remaining until entry deadline:",
-            color=0x00FFAA,
-        )
-        
-        countdown_text = []
-        if days > 0:
-            countdown_text.append(f"**{days}** day{'s' if days != 1 else ''}")
-        if hours > 0 or days > 0:
-            countdown_text.append(f"**{hours}** hour{'s' if hours != 1 else ''}")
-        countdown_text.append(f"**{minutes}** minute{'s' if minutes != 1 else ''}")
-        
-        embed.add_field(
-            name="Time Remaining",
-            value=" ".join(countdown_text),
-            inline=False,
-        )
-        
-        discord_timestamp = int(deadline_dt.timestamp())
-        
-        embed.add_field(
-            name="Deadline",
-            value=f"<t:{discord_timestamp}:F> (<t:{discord_timestamp}:R>)",
-            inline=False,
-        )
-        
-        embed.set_footer(text="Use /enter to submit your guess!")
-        
+        contest_id = int(settings.get("current_contest_id", 1))
+        embed, sig = build_countdown_embed(contest_id, deadline_dt, now)
+    
         # Update or create message
         if message_id:
+            if (message_id, sig) == _last_countdown_sig:
+                return next_interval  # Displayed countdown hasn't changed; skip the edit
             try:
                 message = await channel.fetch_message(message_id)
                 await message.edit(embed=embed)
             except discord.NotFound:
                 # Message was deleted, create new one
                 message = await channel.send(embed=embed)
-                set_countdown_message_id(message.id)
+                await adb(set_countdown_message_id, message.id)
         else:
             # Create new countdown message
             message = await channel.send(embed=embed)
-            set_countdown_message_id(message.id)
-            
+            await adb(set_countdown_message_id, message.id)
+        _last_countdown_sig = (message.id, sig)
+        
     except Exception as e:
         log.exception("Error in countdown update: %s", e)
+    return next_interval
+
+@tasks.loop(seconds=0)  # Paced by the wait below, not by the loop's own interval
+async def update_countdown():
+    """Background task to update countdown message"""
+    _countdown_wake.clear()
+    next_interval = await refresh_countdown()
+    try:
+        await asyncio.wait_for(_countdown_wake.wait(), timeout=next_interval)
+    except asyncio.TimeoutError:
+        pass
 
 # ---------- Logging setup ----------
 
@@ -132,12 +199,39 @@ log.info("Bot starting up")
 
 DB_PATH = "contest.db"
 
+# One connection is opened at startup and shared by every DB helper instead of
+# connecting per call. check_same_thread=False allows use from worker threads;
+# _DB_LOCK serializes access (re-entrant because helpers call each other).
+_CONN = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=256)
+# WAL + synchronous=NORMAL: one fsync per write transaction and readers don't block the writer
+(_journal_mode,) = _CONN.execute("PRAGMA journal_mode=WAL").fetchone()
+if _journal_mode.lower() != "wal":
+    log.warning("SQLite WAL mode unavailable; journal_mode is %s", _journal_mode)
+_CONN.execute("PRAGMA synchronous=NORMAL")
+_CONN.execute("PRAGMA temp_store=MEMORY")
+_CONN.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+_DB_LOCK = threading.RLock()
+
+# Shared statements for the settings key/value table. Keeping the text identical
+# everywhere lets the connection's statement cache reuse the prepared statements.
+_SQL_GET_SETTING = "SELECT value FROM settings WHERE key = ?"
+_SQL_UPSERT_SETTING = (
+    "INSERT INTO settings(key, value) VALUES(?, ?) "
+    "ON CONFLICT(key) DO UPDATE SET value = excluded.value"
+)
+_SQL_DELETE_SETTING = "DELETE FROM settings WHERE key = ?"
+
+# How a contest's opened_at is shown to users; stored next to it as contests.opened_display
+OPENED_DISPLAY_FORMAT = "%Y-%m-%d %H:%M UTC"
+
 # Note: These helper functions are decorated with @with_db to log any SQLite errors that occur within them.
 # normalize_system_name is used to ensure that system name comparisons are consistent regardless of user input formatting (e.g. extra spaces, case differences).
+@lru_cache(maxsize=1024)
 def normalize_system_name(name: str) -> str:
     """Normalize EVE system names so comparisons are consistent."""
-    cleaned = " ".join(name.strip().split())
-    return cleaned.title()
+    cleaned = " ".join(name.split())
+    # Allowed systems map straight to their canonical spelling; anything else is title-cased
+    return _CANONICAL_SYSTEM_NAMES.get(cleaned.lower()) or cleaned.title()
 
 # ---------- Allowed FOB systems ----------
 
@@ -204,14 +298,45 @@ ALLOWED_FOB_SYSTEMS_RAW = [
     "Vlillirier",
 ]
 
+# Lowercased name -> canonical spelling, used by normalize_system_name's fast path
+_CANONICAL_SYSTEM_NAMES = {name.lower(): name for name in ALLOWED_FOB_SYSTEMS_RAW}
+
 # Normalize once so lookups are consistent
-ALLOWED_FOB_SYSTEMS = {normalize_system_name(name) for name in ALLOWED_FOB_SYSTEMS_RAW}
+ALLOWED_FOB_SYSTEMS = frozenset(normalize_system_name(name) for name in ALLOWED_FOB_SYSTEMS_RAW)
+
+# (display name, lowercased name) pairs sorted by display name, precomputed so autocomplete doesn't lowercase every name per keystroke
+_ALLOWED_LOWER = tuple(sorted((name, name.lower()) for name in ALLOWED_FOB_SYSTEMS_RAW))
+# Lowercased names in sorted order, for bisecting straight to the names that start with the typed prefix
+_ALLOWED_SORTED_LOWER = sorted(_CANONICAL_SYSTEM_NAMES)
 
 # is_allowed_fob_system checks if a given system name (after normalization) is in the set of allowed FOB systems, which is used to validate user guesses and the final FOB system set by admins.
+@lru_cache(maxsize=256)
 def is_allowed_fob_system(name: str) -> bool:
     """Return True if the normalized system name is in the allowed FOB list."""
     normalized = normalize_system_name(name)
     return normalized in ALLOWED_FOB_SYSTEMS
+@lru_cache(maxsize=4096)
+# _matching_system_choices filters the allowed systems for one (stripped, lowercased) input. Many users type the same prefixes, so the finished Choice tuples are cached per input; the allowed list is a constant, so they never go stale.
+def _matching_system_choices(lowered: str) -> tuple[app_commands.Choice[str], ...]:
+    # Names starting with the typed text come first: bisect to the first one and walk until the prefix stops matching
+    filtered = []
+    i = bisect.bisect_left(_ALLOWED_SORTED_LOWER, lowered)
+    while (
+        i < len(_ALLOWED_SORTED_LOWER)
+        and len(filtered) < 25
+        and _ALLOWED_SORTED_LOWER[i].startswith(lowered)
+    ):
+        filtered.append(_CANONICAL_SYSTEM_NAMES[_ALLOWED_SORTED_LOWER[i]])
+        i += 1
+    # Then fill up with other case-insensitive substring matches (already in sorted order)
+    if len(filtered) < 25:
+        filtered += [
+            name for name, name_lower in _ALLOWED_LOWER
+            if lowered in name_lower and not name_lower.startswith(lowered)
+        ]
+    # Discord hard limit: max 25 choices
+    return tuple(app_commands.Choice(name=name, value=name) for name in filtered[:25])
+
 # Generates autocomplete choices for system names based on user input. If the user hasn't typed anything yet, it shows a random sample of allowed systems. As the user types, it filters the list to show only matching systems, making it easier for users to find and select valid system names for their guesses.
 async def system_autocomplete(
     interaction: discord.Interaction,
@@ -224,175 +349,238 @@ async def system_autocomplete(
     # User's partial input (case-insensitive)
     typed = current.strip()
 
-    # Work with display names
-    all_names = list(ALLOWED_FOB_SYSTEMS_RAW)
-
     if typed:
-        # Filter by case-insensitive substring, then sort for stable UX
-        lowered = typed.lower()
-        filtered = [name for name in all_names if lowered in name.lower()]
-        filtered.sort()
-    else:
-        # No input yet → randomize the list
-        random.shuffle(all_names)
-        filtered = all_names
-
-    # Discord hard limit: max 25 choices
-    filtered = filtered[:25]
+        return list(_matching_system_choices(typed.lower()))
 
+    # No input yet → random sample, already capped at Discord's 25-choice limit
+    filtered = random.sample(ALLOWED_FOB_SYSTEMS_RAW, min(25, len(ALLOWED_FOB_SYSTEMS_RAW)))
     return [app_commands.Choice(name=name, value=name) for name in filtered]
 
 def with_db(fn):
-    """Decorator to log SQLite errors for DB helper functions."""
+    """Decorator to serialize access to the shared connection and log SQLite errors."""
     def wrapper(*args, **kwargs):
-        try:
-            return fn(*args, **kwargs)
-        except sqlite3.Error as e:
-            log.exception("SQLite error in %s: %s", fn.__name__, e)
-            raise
+        with _DB_LOCK:
+            try:
+                return fn(*args, **kwargs)
+            except sqlite3.Error as e:
+                # Don't leave a half-finished transaction on the shared connection
+                _CONN.rollback()
+                log.exception("SQLite error in %s: %s", fn.__name__, e)
+                raise
     return wrapper
 
+# adb runs a blocking DB helper on a worker thread so SQLite I/O doesn't stall the event loop
+# (gateway heartbeats, other interactions). with_db's lock keeps the shared connection safe.
+async def adb(fn, *args, **kwargs):
+    """Await a synchronous DB helper via asyncio.to_thread."""
+    return await asyncio.to_thread(fn, *args, **kwargs)
+
 # WINNER_PICKED_KEY is used to track whether a winner has already been picked for the current contest, 
 # which can prevent admins from accidentally reopening a contest or picking multiple winners for the same contest.
 WINNER_PICKED_KEY = "winner_picked"
 
 @with_db
 def init_db():
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
+    cur = _CONN.cursor()
 
-    # Per‑contest entries
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS contest_entries (
-            contest_id  INTEGER NOT NULL,
-            user_id     INTEGER NOT NULL,
-            system_name TEXT NOT NULL,
-            entered_at  TEXT NOT NULL,
-            PRIMARY KEY (contest_id, user_id),
-            UNIQUE (contest_id, system_name)
-        )
-        """
-    )
+    # Run all DDL and seed rows as one transaction so startup commits once.
+    # Python does not open a transaction for DDL on its own, hence the explicit BEGIN.
+    with _CONN:
+        cur.execute("BEGIN")
 
-    # Settings key/value store
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS settings (
-            key   TEXT PRIMARY KEY,
-            value TEXT NOT NULL
+        # Per‑contest entries
+        cur.execute(
+            """
+            CREATE TABLE IF NOT EXISTS contest_entries (
+                contest_id  INTEGER NOT NULL,
+                user_id     INTEGER NOT NULL,
+                system_name TEXT NOT NULL,
+                entered_at  TEXT NOT NULL,
+                PRIMARY KEY (contest_id, user_id),
+                UNIQUE (contest_id, system_name)
+            )
+            """
         )
-        """
-    )
-
-    # Contest tracking
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS contests (
-            id             INTEGER PRIMARY KEY AUTOINCREMENT,
-            opened_at      TEXT NOT NULL,
-            winner_user_id INTEGER,
-            winner_system  TEXT
+        # Narrow index for per-contest entry counts
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entries_contest ON contest_entries(contest_id)"
         )
-        """
-    )
-
-    # Ensure there is a current contest row and setting
-    cur.execute("SELECT value FROM settings WHERE key = ?", ("current_contest_id",))
-    row = cur.fetchone()
-
-    if row is None:
-        # No current_contest_id yet: create initial contest row
-        opened_at = datetime.now(UTC).isoformat()
-        cur.execute("INSERT INTO contests(opened_at) VALUES(?)", (opened_at,))
-        contest_id = cur.lastrowid
 
+        # Settings key/value store
         cur.execute(
-            "INSERT INTO settings(key, value) VALUES(?, ?)",
-            ("current_contest_id", str(contest_id)),
+            """
+            CREATE TABLE IF NOT EXISTS settings (
+                key   TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            )
+            """
         )
+
+        # Contest tracking
         cur.execute(
-            "INSERT INTO settings(key, value) VALUES(?, ?)",
-            ("contest_open", "1"),
+            """
+            CREATE TABLE IF NOT EXISTS contests (
+                id             INTEGER PRIMARY KEY AUTOINCREMENT,
+                opened_at      TEXT NOT NULL,
+                winner_user_id INTEGER,
+                winner_system  TEXT,
+                opened_display TEXT
+            )
+            """
         )
+        # Older databases predate opened_display: add it and fill it in from opened_at
+        # (rows SQLite can't parse keep their stored text)
+        cur.execute("PRAGMA table_info(contests)")
+        if "opened_display" not in {column[1] for column in cur.fetchall()}:
+            cur.execute("ALTER TABLE contests ADD COLUMN opened_display TEXT")
+            cur.execute(
+                "UPDATE contests SET opened_display = "
+                "COALESCE(strftime('%Y-%m-%d %H:%M', opened_at) || ' UTC', opened_at)"
+            )
+        # Older databases stored entry_deadline as ISO text: convert it to epoch seconds
+        cur.execute(_SQL_GET_SETTING, ("entry_deadline",))
+        row = cur.fetchone()
+        if row is not None and row[0] and not row[0].isdigit():
+            try:
+                deadline_ts = int(datetime.fromisoformat(row[0]).timestamp())
+            except ValueError:
+                log.warning("Dropping unparsable entry_deadline setting %r", row[0])
+                cur.execute(_SQL_DELETE_SETTING, ("entry_deadline",))
+            else:
+                cur.execute(_SQL_UPSERT_SETTING, ("entry_deadline", str(deadline_ts)))
+        # Partial index over contests that have a winner, for /pastwinners
         cur.execute(
-            "INSERT INTO settings(key, value) VALUES(?, ?)",
-            (WINNER_PICKED_KEY, "0"),
+            "CREATE INDEX IF NOT EXISTS idx_contests_winners "
+            "ON contests(id DESC) WHERE winner_user_id IS NOT NULL"
         )
 
-    conn.commit()
-    conn.close()
+        # Ensure there is a current contest row and setting
+        cur.execute(_SQL_GET_SETTING, ("current_contest_id",))
+        row = cur.fetchone()
+
+        if row is None:
+            # No current_contest_id yet: create initial contest row
+            opened_dt = datetime.now(UTC)
+            cur.execute(
+                "INSERT INTO contests(opened_at, opened_display) VALUES(?, ?)",
+                (opened_dt.isoformat(), opened_dt.strftime(OPENED_DISPLAY_FORMAT)),
+            )
+            contest_id = cur.lastrowid
+
+            cur.executemany(
+                "INSERT INTO settings(key, value) VALUES(?, ?)",
+                [
+                    ("current_contest_id", str(contest_id)),
+                    ("contest_open", "1"),
+                    (WINNER_PICKED_KEY, "0"),
+                ],
+            )
 
 # Create tables if they don't exist and bootstrap current_contest_id
 init_db()
 
 # ---------- Helper functions ----------
 
+# SQL expression for the current contest id. Helpers that take an optional contest_id use
+# COALESCE(?, _CURRENT_CONTEST_SQL) so the lookup happens inside their own query.
+_CURRENT_CONTEST_SQL = "(SELECT CAST(value AS INTEGER) FROM settings WHERE key = 'current_contest_id')"
+
+# In-memory mirror of the settings table. It is loaded once at startup and every write goes
+# through write_setting (or start_new_contest), so the getters below never need to query SQLite.
+_SETTINGS_CACHE: dict[str, str] = {}
+# Decoded prize list, derived from the "prizes_text" setting on first use
+_prizes_cache: list[str] | None = None
+
 @with_db
+# load_settings_cache (re)reads the whole settings table into _SETTINGS_CACHE.
+def load_settings_cache() -> None:
+    global _prizes_cache
+    cur = _CONN.cursor()
+    cur.execute("SELECT key, value FROM settings")
+    _SETTINGS_CACHE.clear()
+    _SETTINGS_CACHE.update(cur.fetchall())
+    _prizes_cache = None
+
+@with_db
+# write_setting upserts a setting (or deletes it when value is None) and mirrors the change in _SETTINGS_CACHE once it is committed.
+def write_setting(key: str, value: str | None) -> None:
+    with _CONN:
+        if value is None:
+            _CONN.execute(_SQL_DELETE_SETTING, (key,))
+        else:
+            _CONN.execute(_SQL_UPSERT_SETTING, (key, value))
+    if value is None:
+        _SETTINGS_CACHE.pop(key, None)
+    else:
+        _SETTINGS_CACHE[key] = value
+
+# Prime the cache from the tables init_db just created or migrated
+load_settings_cache()
+
+# get_settings_bulk returns several settings at once, for callers (like update_countdown) that need more than one value at a time.
+def get_settings_bulk(keys: tuple[str, ...]) -> dict[str, str]:
+    """Return {key: value} for the given settings keys that are present."""
+    return {key: _SETTINGS_CACHE[key] for key in keys if key in _SETTINGS_CACHE}
+
+
 # get_current_contest_id is used to determine which contest the user entries belong to, and to track the current contest in the settings table.
 def get_current_contest_id() -> int:
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute(
-        "SELECT value FROM settings WHERE key = ?",
-        ("current_contest_id",),
-    )
-    row = cur.fetchone()
-    conn.close()
-    if row is None:
-        return 1
-    return int(row[0])
+    return int(_SETTINGS_CACHE.get("current_contest_id", 1))
 
 
 @with_db
-# get_contest_open_date is used to show when the current contest was opened, which can be helpful for admins to track contest history and timing.
+# get_contest_open_date is used to show when the current contest was opened, which can be helpful for admins to track contest history and timing. It returns the display form stored alongside opened_at.
 def get_contest_open_date(contest_id: int) -> str | None:
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
+    cur = _CONN.cursor()
     cur.execute(
-        "SELECT opened_at FROM contests WHERE id = ?",
+        "SELECT opened_display FROM contests WHERE id = ?",
         (contest_id,),
     )
     row = cur.fetchone()
-    conn.close()
     return row[0] if row else None
 
 
-@with_db
 # get_prizes_text and set_prizes_text are used to store and retrieve the current prize description for the contest, which can be displayed to users with the /prizes command.
 def get_prizes_text() -> str | None:
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute("SELECT value FROM settings WHERE key = ?", ("prizes_text",))
-    row = cur.fetchone()
-    conn.close()
-    return row[0] if row else None
+    return _SETTINGS_CACHE.get("prizes_text")
 
 
-@with_db
 # set_prizes_text allows admins to update the prize description for the contest, which can be important for keeping the contest information current and engaging for participants.
 def set_prizes_text(text: str) -> None:
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT INTO settings(key, value) VALUES(?, ?) "
-        "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-        ("prizes_text", text),
-    )
-    conn.commit()
-    conn.close()
+    global _prizes_cache
+    write_setting("prizes_text", text)
+    _prizes_cache = None
 
 def get_prizes_list() -> list[str]:
     """
     Return the current prizes as an ordered list of strings.
-    Stored as JSON in the 'prizes_text' setting for flexibility.
-    Falls back to treating old plain-text data as a single-element list.
+    Stored in the 'prizes_text' setting, each prize followed by PRIZE_SEPARATOR.
+    Falls back to reading old JSON lists, and old plain-text data as a single-element list.
     """
+    global _prizes_cache
+    if _prizes_cache is None:
+        _prizes_cache = _load_prizes_list()
+    return list(_prizes_cache)
+
+# ASCII unit separator ending each prize in 'prizes_text'; older databases may still hold a JSON list
+PRIZE_SEPARATOR = "\x1f"
+
+def _load_prizes_list() -> list[str]:
+    """Decode the stored prize list."""
     raw = get_prizes_text()
     if not raw:
         return []
 
-    # First try: interpret as JSON list
+    # Current format: every prize ends with the ASCII unit separator, so even a single
+    # prize that looks like JSON can't be mistaken for the legacy format
+    if PRIZE_SEPARATOR in raw:
+        return raw.removesuffix(PRIZE_SEPARATOR).split(PRIZE_SEPARATOR)
+
+    # Legacy format: plain text (or a single prize) -> treat as one prize (skip the JSON attempt entirely)
+    if raw[:1] != "[":
+        return [raw]
+
+    # Legacy format: JSON list
     try:
         data = json.loads(raw)
         if isinstance(data, list):
@@ -401,292 +589,365 @@ def get_prizes_list() -> list[str]:
         # Not valid JSON; fall through to treat as legacy text
         pass
 
-    # Legacy format: plain text -> treat as one prize
     return [raw]
 
-    """
-    Return the current prizes as an ordered list of strings.
-    Stored as JSON in the 'prizes_text' setting for flexibility.
-    """
-    raw = get_prizes_text()
-    if not raw:
-        return []
-
-    try:
-        data = json.loads(raw)
-        # If it’s already a list, return it as list of strings
-        if isinstance(data, list):
-            return [str(item) for item in data]
-    except json.JSONDecodeError:
-        # Old data: treat as single blob
-        return [raw]
-
-    return []
-
 def set_prizes_list(prizes: list[str]) -> None:
     """
-    Store the given ordered list of prizes as JSON in 'prizes_text'.
+    Store the given ordered list of prizes in 'prizes_text', each followed by PRIZE_SEPARATOR.
     """
-    raw = json.dumps(prizes, ensure_ascii=False)
-    set_prizes_text(raw)
+    global _prizes_cache
+    # Strip the separator from user input so it can't split a prize in two
+    prizes = [p.replace(PRIZE_SEPARATOR, "") for p in prizes]
+    set_prizes_text("".join(p + PRIZE_SEPARATOR for p in prizes))
+    _prizes_cache = prizes
 
 
 @with_db
 # get_user_entry retrieves the system name that a user has entered for the current contest, which is used in the /myguess command and to check if a user has already entered.
-def get_user_entry(user_id: int) -> str | None:
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    contest_id = get_current_contest_id()
+def get_user_entry(user_id: int, contest_id: int | None = None) -> str | None:
+    cur = _CONN.cursor()
     cur.execute(
-        "SELECT system_name FROM contest_entries WHERE contest_id = ? AND user_id = ?",
+        "SELECT system_name FROM contest_entries "
+        f"WHERE contest_id = COALESCE(?, {_CURRENT_CONTEST_SQL}) AND user_id = ?",
         (contest_id, user_id),
     )
     row = cur.fetchone()
-    conn.close()
     return row[0] if row else None
 
 
+# Entries known to exist, per contest: {contest_id: {user_id: system_name}} and {contest_id: {system_name, ...}}.
+# They are only filled from rows that are in contest_entries, so a hit lets /enter reject a duplicate
+# without touching SQLite; a miss still has to ask the database (e.g. right after a restart).
+_ENTERED_USERS: dict[int, dict[int, str]] = {}
+_TAKEN_SYSTEMS: dict[int, set[str]] = {}
+
+def _remember_entry(contest_id: int, user_id: int, system_name: str) -> None:
+    _ENTERED_USERS.setdefault(contest_id, {})[user_id] = system_name
+    _TAKEN_SYSTEMS.setdefault(contest_id, set()).add(system_name)
+
+def forget_known_entries() -> None:
+    """Drop the in-memory entry index (after /newcontest)."""
+    _ENTERED_USERS.clear()
+    _TAKEN_SYSTEMS.clear()
+
+
 @with_db
-# set_user_entry inserts or updates a user's entry for the current contest. It uses an UPSERT statement to ensure that if the user has already entered, their entry will be updated with the new system name and timestamp instead of creating a duplicate entry.
-def set_user_entry(user_id: int, system_name: str) -> None:
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    contest_id = get_current_contest_id()
+# add_user_entry records a new entry only if the user hasn't entered and the system isn't taken in the current contest. Both checks are enforced by the table's constraints within one INSERT, so two concurrent /enter calls can't claim the same system.
+def add_user_entry(user_id: int, system_name: str, contest_id: int | None = None) -> bool:
+    """Insert a new entry; return False if the user or the system is already taken."""
+    if contest_id is None:
+        contest_id = get_current_contest_id()
+    cur = _CONN.cursor()
     entered_at = datetime.now(UTC).isoformat()
-    
+
     cur.execute(
         "INSERT INTO contest_entries(contest_id, user_id, system_name, entered_at) "
         "VALUES(?, ?, ?, ?) "
-        "ON CONFLICT(contest_id, user_id) "
-        "DO UPDATE SET system_name = excluded.system_name, entered_at = excluded.entered_at",
+        "ON CONFLICT DO NOTHING",
         (contest_id, user_id, system_name, entered_at),
     )
-    conn.commit()
-    conn.close()
+    _CONN.commit()
+    if cur.rowcount != 1:
+        return False
+    _remember_entry(contest_id, user_id, system_name)
+    return True
 
 
 @with_db
-# is_system_taken checks if a given system name has already been entered by another user for the current contest, which is used to enforce the rule that each system can only be guessed by one participant.
-def is_system_taken(system_name: str) -> bool:
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    contest_id = get_current_contest_id()
+# check_entry_conflicts looks up, in one query, the system a user already entered and whether a system is already taken in the current contest. /enter uses it to enforce both the one-entry-per-pilot and one-pilot-per-system rules.
+def check_entry_conflicts(user_id: int, system_name: str, contest_id: int | None = None) -> tuple[str | None, bool]:
+    """
+    Return (the user's previous system or None, whether system_name is taken).
+    If the user's entry is already known in memory the database isn't queried
+    (/enter rejects on that first, so whether the system is taken doesn't matter then).
+    """
+    if contest_id is None:
+        # Resolved up front: a subquery here would stop SQLite from using an index for each side of the OR
+        contest_id = get_current_contest_id()
+    previous = _ENTERED_USERS.get(contest_id, {}).get(user_id)
+    taken = system_name in _TAKEN_SYSTEMS.get(contest_id, ())
+    if previous is not None:
+        return previous, taken
+
+    cur = _CONN.cursor()
+    # Each side of the OR is covered by an index (the primary key and the UNIQUE constraint), so at most two rows come back
     cur.execute(
-        "SELECT 1 FROM contest_entries WHERE contest_id = ? AND system_name = ?",
-        (contest_id, system_name),
+        "SELECT user_id, system_name FROM contest_entries "
+        "WHERE contest_id = ? AND (user_id = ? OR system_name = ?)",
+        (contest_id, user_id, system_name),
     )
-    row = cur.fetchone()
-    conn.close()
-    return row is not None
+    for entry_user_id, entry_system in cur.fetchall():
+        _remember_entry(contest_id, entry_user_id, entry_system)
+        if entry_user_id == user_id:
+            previous = entry_system
+        if entry_system == system_name:
+            taken = True
+    return previous, taken
 
 
-@with_db
 # is_contest_open checks the settings table for the "contest_open" key to determine if the contest is currently accepting entries. This is used in the /enter command to prevent users from entering when the contest is closed.
 def is_contest_open() -> bool:
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute("SELECT value FROM settings WHERE key = ?", ("contest_open",))
-    row = cur.fetchone()
-    conn.close()
-    if row is None:
-        return True
-    return row[0] == "1"
+    return _SETTINGS_CACHE.get("contest_open", "1") == "1"
 
 
-@with_db
 # set_contest_open updates the "contest_open" setting in the database to control whether the contest is accepting entries.
 def set_contest_open(open_flag: bool) -> None:
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT INTO settings(key, value) VALUES(?, ?) "
-        "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-        ("contest_open", "1" if open_flag else "0"),
-    )
-    conn.commit()
-    conn.close()
+    write_setting("contest_open", "1" if open_flag else "0")
 
 
-@with_db
 # get_fob_system retrieves the actual FOB system that was set by an admin after the FOB spawns. This is used to determine the winner when picking a winner from the entries.
 def get_fob_system() -> str | None:
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute("SELECT value FROM settings WHERE key = ?", ("fob_system",))
-    row = cur.fetchone()
-    conn.close()
-    return row[0] if row else None
+    return _SETTINGS_CACHE.get("fob_system")
 
 
-@with_db
 # set_fob_system allows admins to set the actual FOB system after it spawns, which is essential for determining the winner of the contest based on the entries that guessed that system.
 def set_fob_system(system_name: str) -> None:
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT INTO settings(key, value) VALUES(?, ?) "
-        "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-        ("fob_system", system_name),
-    )
-    conn.commit()
-    conn.close()
+    write_setting("fob_system", system_name)
 
-@with_db
 # is_winner_picked checks if a winner has already been picked for the current contest by looking up the "winner_picked" key in the settings table. This is used to prevent reopening a contest that already has a winner.
 def is_winner_picked() -> bool:
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute(
-        "SELECT value FROM settings WHERE key = ?",
-        (WINNER_PICKED_KEY,),
-    )
-    row = cur.fetchone()
-    conn.close()
-    if row is None:
-        return False
-    return row[0] == "1"
+    return _SETTINGS_CACHE.get(WINNER_PICKED_KEY) == "1"
 
 
-@with_db
 # set_winner_picked updates the "winner_picked" setting in the database to indicate whether a winner has been picked for the current contest. This can be used to enforce rules around reopening contests or picking winners.
 def set_winner_picked(picked: bool) -> None:
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT INTO settings(key, value) VALUES(?, ?) "
-        "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-        (WINNER_PICKED_KEY, "1" if picked else "0"),
-    )
-    conn.commit()
-    conn.close()
+    write_setting(WINNER_PICKED_KEY, "1" if picked else "0")
 
 
-@with_db
 # get_entry_deadline retrieves the entry deadline timestamp from the settings table, which can be used to automatically close entries when the deadline has passed.
 def get_entry_deadline() -> str | None:
-    """Get entry deadline timestamp (ISO format)"""
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute("SELECT value FROM settings WHERE key = ?", ("entry_deadline",))
-    row = cur.fetchone()
-    conn.close()
-    return row[0] if row else None
+    """Get entry deadline timestamp (Unix epoch seconds, as stored text)"""
+    return _SETTINGS_CACHE.get("entry_deadline")
 
-@with_db
 # set_entry_deadline allows admins to set the entry deadline for the contest, which can be used to automatically close entries when the deadline has passed.
-def set_entry_deadline(deadline_iso: str | None) -> None:
-    """Set entry deadline timestamp (ISO format), or clear if None"""
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    if deadline_iso is None:
-        cur.execute("DELETE FROM settings WHERE key = ?", ("entry_deadline",))
-    else:
-        cur.execute(
-            "INSERT INTO settings(key, value) VALUES(?, ?) "
-            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-            ("entry_deadline", deadline_iso),
-        )
-    conn.commit()
-    conn.close()
+def set_entry_deadline(deadline_ts: int | None) -> None:
+    """Set entry deadline timestamp (Unix epoch seconds), or clear if None"""
+    write_setting("entry_deadline", None if deadline_ts is None else str(deadline_ts))
+
+# Last (raw stored string, parsed datetime, epoch seconds) triple, so an unchanged deadline isn't re-parsed on every use
+_deadline_cache: tuple[str | None, datetime | None, int | None] = (None, None, None)
+
+def _refresh_deadline_cache(deadline: str) -> None:
+    global _deadline_cache
+    if _deadline_cache[0] != deadline:
+        deadline_ts = int(deadline)
+        _deadline_cache = (deadline, datetime.fromtimestamp(deadline_ts, UTC), deadline_ts)
+
+# parse_entry_deadline turns the stored epoch deadline into a datetime. The countdown task and /enter call it repeatedly with the same value, so the last result is reused.
+def parse_entry_deadline(deadline: str) -> datetime:
+    """Parse a stored epoch deadline string, reusing the previous result when unchanged."""
+    _refresh_deadline_cache(deadline)
+    return _deadline_cache[1]
+
+# get_entry_deadline_ts returns the current deadline as integer epoch seconds, ready for Discord <t:...> timestamps.
+def get_entry_deadline_ts() -> int | None:
+    """Get entry deadline as a Unix timestamp, or None if no deadline is set"""
+    deadline = get_entry_deadline()
+    if not deadline:
+        return None
+    _refresh_deadline_cache(deadline)
+    return _deadline_cache[2]
+
+# parse_deadline_input reads the fixed-width "YYYY-MM-DD HH:MM" (UTC) text from DeadlineModal by slicing, since the modal already enforces exactly 16 characters.
+def parse_deadline_input(value: str) -> datetime:
+    """Parse 'YYYY-MM-DD HH:MM' as a UTC datetime, raising ValueError if malformed."""
+    # isascii() keeps \d from accepting non-ASCII digits
+    if not (value.isascii() and _DEADLINE_RE.fullmatch(value)):
+        raise ValueError(f"Invalid deadline: {value!r}")
+    return datetime(
+        int(value[0:4]), int(value[5:7]), int(value[8:10]),
+        int(value[11:13]), int(value[14:16]),
+        tzinfo=UTC,
+    )
 
-@with_db
 # is_past_deadline checks if the current time is past the entry deadline that may be set by an admin. This can be used to automatically close entries when the deadline has passed, even if an admin forgets to manually close the contest.
 def is_past_deadline() -> bool:
     """Check if current time is past entry deadline"""
-    deadline = get_entry_deadline()
-    if deadline is None:
+    deadline_ts = get_entry_deadline_ts()
+    if deadline_ts is None:
         return False
     
-    deadline_dt = datetime.fromisoformat(deadline)
-    now = datetime.now(UTC)
-    return now >= deadline_dt
+    return time.time() >= deadline_ts
 
-@with_db
 # get_countdown_message_id and set_countdown_message_id are used to store the message ID of the countdown message that is posted in the channel. This allows the update_countdown task to edit the existing message instead of posting a new one every time it updates, which keeps the channel cleaner and more organized.
 def get_countdown_message_id() -> int | None:
     """Get the message ID of the active countdown"""
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute("SELECT value FROM settings WHERE key = ?", ("countdown_message_id",))
-    row = cur.fetchone()
-    conn.close()
-    return int(row[0]) if row else None
+    value = _SETTINGS_CACHE.get("countdown_message_id")
+    return int(value) if value else None
 
-@with_db
 # set_countdown_message_id stores the message ID of the countdown message in the settings table. If the message ID is None, it deletes the setting, which can be used to indicate that there is no active countdown message (e.g. if it was deleted).
 def set_countdown_message_id(message_id: int | None) -> None:
     """Store the countdown message ID"""
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    if message_id is None:
-        cur.execute("DELETE FROM settings WHERE key = ?", ("countdown_message_id",))
-    else:
-        cur.execute(
-            "INSERT INTO settings(key, value) VALUES(?, ?) "
-            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-            ("countdown_message_id", str(message_id)),
-        )
-    conn.commit()
-    conn.close()
+    write_setting("countdown_message_id", None if message_id is None else str(message_id))
 
-@with_db
-# get_countdown_channel_id and set_countdown_channel_id are used to store the channel ID where the countdown message is posted. This allows the bot to know which channel to post the countdown message in and where to edit it when updating.
+# get_countdown_channel_id reads the stored channel ID where the countdown message is posted (set_deadline_and_channel writes it). This allows the bot to know which channel to post the countdown message in and where to edit it when updating.
 def get_countdown_channel_id() -> int | None:
     """Get the channel ID for countdown messages"""
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute("SELECT value FROM settings WHERE key = ?", ("countdown_channel_id",))
-    row = cur.fetchone()
-    conn.close()
-    return int(row[0]) if row else None
+    value = _SETTINGS_CACHE.get("countdown_channel_id")
+    return int(value) if value else None
 
 @with_db
-# set_countdown_channel_id stores the channel ID for the countdown messages in the settings table. This allows admins to configure which channel the countdown updates will be posted in.
-def set_countdown_channel_id(channel_id: int) -> None:
-    """Store the channel ID for countdown messages"""
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute(
-        "INSERT INTO settings(key, value) VALUES(?, ?) "
-        "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-        ("countdown_channel_id", str(channel_id)),
-    )
-    conn.commit()
-    conn.close()
+# set_deadline_and_channel stores a new entry deadline together with the channel its countdown is posted in, in one transaction (one commit instead of two).
+def set_deadline_and_channel(deadline_ts: int, channel_id: int) -> None:
+    values = {"entry_deadline": str(deadline_ts), "countdown_channel_id": str(channel_id)}
+    with _CONN:
+        _CONN.executemany(_SQL_UPSERT_SETTING, values.items())
+    _SETTINGS_CACHE.update(values)
 
 @with_db
 # get_total_entries_for_current_contest counts the total number of entries for the current contest, which can be displayed in the contest status to show how many participants have entered.
-def get_total_entries_for_current_contest() -> int:
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    contest_id = get_current_contest_id()
+def get_total_entries_for_current_contest(contest_id: int | None = None) -> int:
+    cur = _CONN.cursor()
     cur.execute(
-        "SELECT COUNT(*) FROM contest_entries WHERE contest_id = ?",
+        f"SELECT COUNT(*) FROM contest_entries WHERE contest_id = COALESCE(?, {_CURRENT_CONTEST_SQL})",
         (contest_id,),
     )
     (count,) = cur.fetchone()
-    conn.close()
     return count
 
 @with_db
 # get_current_winner_info retrieves the user ID and system name of the winner for the current contest, which can be used to display the winner information in the contest status or other commands.
-def get_current_winner_info() -> tuple[int | None, str | None]:
+def get_current_winner_info(contest_id: int | None = None) -> tuple[int | None, str | None]:
     """Return (winner_user_id, winner_system) for the current contest."""
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    contest_id = get_current_contest_id()
+    cur = _CONN.cursor()
     cur.execute(
-        "SELECT winner_user_id, winner_system FROM contests WHERE id = ?",
+        f"SELECT winner_user_id, winner_system FROM contests WHERE id = COALESCE(?, {_CURRENT_CONTEST_SQL})",
         (contest_id,),
     )
     row = cur.fetchone()
-    conn.close()
 
     if not row:
         return None, None
 
     return row[0], row[1]
 
+@with_db
+# pick_random_entry_for_system returns the user_id of a random entry in a contest that guessed the given system, or None if nobody did. The random pick happens in SQLite, so matching rows are never copied into Python.
+def pick_random_entry_for_system(contest_id: int, system_name: str) -> int | None:
+    cur = _CONN.cursor()
+    cur.execute(
+        "SELECT user_id FROM contest_entries "
+        "WHERE contest_id = ? AND system_name = ? ORDER BY RANDOM() LIMIT 1",
+        (contest_id, system_name),
+    )
+    row = cur.fetchone()
+    return row[0] if row else None
+
+@with_db
+# set_contest_winner records the winning user and system on the contest row, which is what /pastwinners and /contesthistory display.
+def set_contest_winner(contest_id: int, winner_user_id: int, winner_system: str) -> None:
+    with _CONN:
+        _CONN.execute(
+            "UPDATE contests SET winner_user_id = ?, winner_system = ? WHERE id = ?",
+            (winner_user_id, winner_system, contest_id),
+        )
+
+# /listentries shows this many entries per page, keeping each message well under Discord's 2000-character limit
+ENTRIES_PAGE_SIZE = 25
+
+@with_db
+# get_contest_entries lists (user_id, system_name) for one page of entries in a contest, used by /listentries.
+def get_contest_entries(contest_id: int, page: int = 0) -> list[tuple[int, str]]:
+    cur = _CONN.cursor()
+    # ORDER BY user_id follows the (contest_id, user_id) primary key, so pages come straight off the index
+    cur.execute(
+        "SELECT user_id, system_name FROM contest_entries "
+        "WHERE contest_id = ? ORDER BY user_id LIMIT ? OFFSET ?",
+        (contest_id, ENTRIES_PAGE_SIZE, page * ENTRIES_PAGE_SIZE),
+    )
+    return cur.fetchall()
+
+# Discord embeds hold at most 25 fields, so history listings are fetched one page of this size at a time
+HISTORY_PAGE_SIZE = 25
+
+@with_db
+# get_contest_history returns one page of contests, newest first, regardless of whether they have a winner.
+def get_contest_history(page: int = 1) -> list[tuple[int, str, int | None, str | None]]:
+    cur = _CONN.cursor()
+    cur.execute(
+        """
+        SELECT c.id, c.opened_display, c.winner_user_id, c.winner_system
+        FROM contests c
+        ORDER BY c.id DESC
+        LIMIT ? OFFSET ?
+        """,
+        (HISTORY_PAGE_SIZE, (page - 1) * HISTORY_PAGE_SIZE),
+    )
+    return cur.fetchall()
+
+@with_db
+# get_past_winners returns the most recent contests that have a winner (up to one embed's worth), newest first.
+def get_past_winners() -> list[tuple[int, str, int, str]]:
+    cur = _CONN.cursor()
+    cur.execute(
+        """
+        SELECT c.id, c.opened_display, c.winner_user_id, c.winner_system
+        FROM contests c
+        WHERE c.winner_user_id IS NOT NULL
+        ORDER BY c.id DESC
+        LIMIT ?
+        """,
+        (HISTORY_PAGE_SIZE,),
+    )
+    return cur.fetchall()
+
+@with_db
+# backup_database writes a consistent copy of the live database using SQLite's online backup API, so in-flight WAL pages can't tear the copy the way a plain file copy could.
+def backup_database(backup_path: str) -> None:
+    dst = sqlite3.connect(backup_path)
+    try:
+        with dst:
+            # Copy in chunks of 1024 pages rather than one big step
+            _CONN.backup(dst, pages=1024)
+    finally:
+        dst.close()
+
+@with_db
+# start_new_contest closes the current contest, creates a new contest row and resets the per-contest settings, all in one transaction. Returns (new_contest_id, opened_display).
+def start_new_contest() -> tuple[int, str]:
+    opened_dt = datetime.now(UTC)
+    opened_display = opened_dt.strftime(OPENED_DISPLAY_FORMAT)
+    with _CONN:
+        cur = _CONN.cursor()
+        # Take the write lock up front so the whole reset commits as one unit
+        cur.execute("BEGIN IMMEDIATE")
+
+        # Insert a new contest row with today's date (UTC)
+        cur.execute(
+            "INSERT INTO contests(opened_at, opened_display) VALUES(?, ?)",
+            (opened_dt.isoformat(), opened_display),
+        )
+        new_contest_id = cur.lastrowid
+
+        # Point current_contest_id at the new contest, reopen entries, clear the
+        # FOB system (settings is global) and reset the winner-picked flag
+        cur.executemany(
+            _SQL_UPSERT_SETTING,
+            [
+                ("current_contest_id", str(new_contest_id)),
+                ("contest_open", "1"),
+                ("fob_system", ""),
+                (WINNER_PICKED_KEY, "0"),
+            ],
+        )
+        # Clear the deadline. The countdown message tracking is kept, so DeadlineModal
+        # can edit the existing countdown for the new contest instead of posting another
+        cur.execute(_SQL_DELETE_SETTING, ("entry_deadline",))
+
+    # Mirror the committed changes in the settings cache
+    _SETTINGS_CACHE.update(
+        {
+            "current_contest_id": str(new_contest_id),
+            "contest_open": "1",
+            "fob_system": "",
+            WINNER_PICKED_KEY: "0",
+        }
+    )
+    _SETTINGS_CACHE.pop("entry_deadline", None)
+    # Entries known for the old contest are no longer needed
+    forget_known_entries()
+    return new_contest_id, opened_display
+
 # ---------- Discord bot setup ----------
 
 intents = discord.Intents.default()
@@ -865,23 +1126,44 @@ class SetPrizesModal(discord.ui.Modal, title="Set Contest Prizes"):
         max_length=200,
     )
 
+    def __init__(self, prize_count: int | None = None):
+        super().__init__()
+        self.prize_count = prize_count
+        if prize_count is not None:
+            # Count already given to /setprizes: show only that many prize boxes, all required.
+            # They are rebuilt rather than relabelled, since TextInput.label's setter is deprecated.
+            self.clear_items()
+            for idx in range(prize_count):
+                name = f"prize{idx+1}"
+                field = discord.ui.TextInput(
+                    label=f"Prize {idx+1}",
+                    placeholder=getattr(self, name).placeholder,
+                    required=True,
+                    max_length=200,
+                )
+                setattr(self, name, field)
+                self.add_item(field)
+
     async def on_submit(self, interaction: discord.Interaction):
-        # Validate count
-        try:
-            n = int(self.count.value)
-        except ValueError:
-            await interaction.response.send_message(
-                "Please enter a number between 1 and 4 for the prize count.",
-                ephemeral=True,
-            )
-            return
+        if self.prize_count is not None:
+            n = self.prize_count
+        else:
+            # Validate count
+            try:
+                n = int(self.count.value)
+            except ValueError:
+                await interaction.response.send_message(
+                    "Please enter a number between 1 and 4 for the prize count.",
+                    ephemeral=True,
+                )
+                return
 
-        if not (1 <= n <= 4):
-            await interaction.response.send_message(
-                "Prize count must be between 1 and 4.",
-                ephemeral=True,
-            )
-            return
+            if not (1 <= n <= 4):
+                await interaction.response.send_message(
+                    "Prize count must be between 1 and 4.",
+                    ephemeral=True,
+                )
+                return
 
         # Collect up to n non-empty prize fields in order
         fields = [self.prize1, self.prize2, self.prize3, self.prize4]
@@ -896,8 +1178,8 @@ class SetPrizesModal(discord.ui.Modal, title="Set Contest Prizes"):
                 return
             prizes.append(value)
 
-        # Save to DB as JSON list
-        set_prizes_list(prizes)
+        # Save to DB as an ordered list
+        await adb(set_prizes_list, prizes)
 
         # Build ordered list preview
         lines = [f"{idx+1}. {p}" for idx, p in enumerate(prizes)]
@@ -909,7 +1191,8 @@ class SetPrizesModal(discord.ui.Modal, title="Set Contest Prizes"):
     name="setprizes",
     description="Set the ordered prize list for the FOB contest (admins only, up to 4 prizes).",
 )
-async def setprizes(interaction: discord.Interaction):
+@app_commands.describe(count="How many prizes (1–4). If given, the form only shows that many prize boxes.")
+async def setprizes(interaction: discord.Interaction, count: Optional[app_commands.Range[int, 1, 4]] = None):
     if not is_contest_admin(interaction):
         await interaction.response.send_message(
             "You do not have permission to set prizes.",
@@ -917,9 +1200,26 @@ async def setprizes(interaction: discord.Interaction):
         )
         return
 
-    modal = SetPrizesModal()
+    modal = SetPrizesModal(count)
     await interaction.response.send_modal(modal)
 
+# Static parts of the /endcontest announcements; on_submit only fills in the contest-specific values
+_NO_WINNER_EMBED_TEMPLATE = {
+    "title": "🏁 Contest Ended - No Winner",
+    "color": 0xFF6B6B,  # Red-ish
+    "footer": {"text": "Fly dangerous o7"},
+}
+_NO_WINNER_RESULT_FIELD = {
+    "name": "Result",
+    "value": "No pilots guessed correctly. Better luck in the next contest!",
+    "inline": False,
+}
+_WINNER_EMBED_TEMPLATE = {
+    "title": "🏆 Contest Winner Announced!",
+    "color": 0xFFD700,  # Gold
+    "footer": {"text": "Congratulations to the winner! o7"},
+}
+
 # /endcontest command to close entries
 # Create Modal for FOB System Input
 class EndContestModal(discord.ui.Modal, title='End Contest & Set FOB System'):
@@ -936,13 +1236,15 @@ class EndContestModal(discord.ui.Modal, title='End Contest & Set FOB System'):
         self.channel_id = channel_id
     
     async def on_submit(self, interaction: discord.Interaction):
+        # Acknowledge right away so the DB work and announcement below can't outrun Discord's 3-second window
+        await interaction.response.defer(ephemeral=True)
         try:
             # Normalize the system name
             system_norm = normalize_system_name(self.fob_system_input.value)
 
             # Validate system against allowed list
             if not is_allowed_fob_system(system_norm):
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     "That system is not in the list of allowed Guristas FOB systems for this contest.\n"
                     "Please enter a valid GalMil/CalMil system from the approved list.",
                     ephemeral=True,
@@ -950,26 +1252,17 @@ class EndContestModal(discord.ui.Modal, title='End Contest & Set FOB System'):
                 return
             
             # Close the contest
-            set_contest_open(False)
+            await adb(set_contest_open, False)
             
             # Set the FOB system
-            set_fob_system(system_norm)
+            await adb(set_fob_system, system_norm)
             
-            # Find matching entries
-            conn = sqlite3.connect(DB_PATH)
-            cur = conn.cursor()
-            cur.execute(
-                "SELECT user_id, system_name FROM contest_entries "
-                "WHERE contest_id = ? AND system_name = ?",
-                (self.contest_id, system_norm),
-            )
-            rows = cur.fetchall()
+            # Pick a random winner from the correct entries, if any
+            winner_user_id = await adb(pick_random_entry_for_system, self.contest_id, system_norm)
             
-            if not rows:
+            if winner_user_id is None:
                 # No winner - no correct guesses
-                conn.close()
-                
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"❌ Contest #{self.contest_id} has ended.\n"
                     f"🎯 FOB system was: **{system_norm}**\n"
                     f"😢 No entries guessed correctly. Better luck next time!",
@@ -978,39 +1271,23 @@ class EndContestModal(discord.ui.Modal, title='End Contest & Set FOB System'):
                 
                 # Send public announcement
                 channel = interaction.channel
-                embed = discord.Embed(
-                    title="🏁 Contest Ended - No Winner",
-                    description=f"The Guristas FOB Contest #{self.contest_id} has concluded.",
-                    color=0xFF6B6B,  # Red-ish
-                )
-                embed.add_field(
-                    name="FOB System",
-                    value=f"**{system_norm}**",
-                    inline=False,
-                )
-                embed.add_field(
-                    name="Result",
-                    value="No pilots guessed correctly. Better luck in the next contest!",
-                    inline=False,
-                )
-                embed.set_footer(text="Fly dangerous o7")
+                embed = discord.Embed.from_dict({
+                    **_NO_WINNER_EMBED_TEMPLATE,
+                    "description": f"The Guristas FOB Contest #{self.contest_id} has concluded.",
+                    "fields": [
+                        {"name": "FOB System", "value": f"**{system_norm}**", "inline": False},
+                        _NO_WINNER_RESULT_FIELD,
+                    ],
+                })
                 
                 await channel.send(embed=embed)
                 return
             
-            # Pick random winner from correct entries
-            winner_user_id, _ = random.choice(rows)
-            
             # Mark winner as picked
-            set_winner_picked(True)
+            await adb(set_winner_picked, True)
             
             # Update contest record
-            cur.execute(
-                "UPDATE contests SET winner_user_id = ?, winner_system = ? WHERE id = ?",
-                (winner_user_id, system_norm, self.contest_id),
-            )
-            conn.commit()
-            conn.close()
+            await adb(set_contest_winner, self.contest_id, winner_user_id, system_norm)
             
             # Get prize information
             prizes_list = get_prizes_list()
@@ -1021,7 +1298,7 @@ class EndContestModal(discord.ui.Modal, title='End Contest & Set FOB System'):
                 prizes_text = "\n".join(prize_lines)
 
             # Send admin confirmation
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"✅ Contest #{self.contest_id} has ended.\n"
                 f"🎯 FOB system: **{system_norm}**\n"
                 f"🏆 Winner: <@{winner_user_id}>\n"
@@ -1031,39 +1308,27 @@ class EndContestModal(discord.ui.Modal, title='End Contest & Set FOB System'):
 
             # Send public winner announcement
             channel = interaction.channel
-            embed = discord.Embed(
-                title="🏆 Contest Winner Announced!",
-                description=f"The Guristas FOB Contest #{self.contest_id} has concluded!",
-                color=0xFFD700,  # Gold
-            )
-            embed.add_field(
-                name="🎯 FOB System",
-                value=f"**{system_norm}**",
-                inline=False,
-            )
-            embed.add_field(
-                name="🎉 Winner",
-                value=f"<@{winner_user_id}>",
-                inline=False,
-            )
-            embed.add_field(
-                name="🎁 Prizes",
-                value=prizes_text,
-                inline=False,
-            )
-            embed.set_footer(text="Congratulations to the winner! o7")
+            embed = discord.Embed.from_dict({
+                **_WINNER_EMBED_TEMPLATE,
+                "description": f"The Guristas FOB Contest #{self.contest_id} has concluded!",
+                "fields": [
+                    {"name": "🎯 FOB System", "value": f"**{system_norm}**", "inline": False},
+                    {"name": "🎉 Winner", "value": f"<@{winner_user_id}>", "inline": False},
+                    {"name": "🎁 Prizes", "value": prizes_text, "inline": False},
+                ],
+            })
 
             await channel.send(content=f"🎊 <@{winner_user_id}> 🎊", embed=embed)
 
         except sqlite3.Error as e:
             log.exception("Error ending contest: %s", e)
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "❌ Failed to end contest due to a database error. Check logs.",
                 ephemeral=True,
             )
         except Exception as e:
             log.exception("Unexpected error ending contest: %s", e)
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"❌ Unexpected error: {e}",
                 ephemeral=True,
             )
@@ -1100,14 +1365,7 @@ async def endcontest(interaction: discord.Interaction):
 
     # 4) Make sure there is at least one entry
     contest_id = get_current_contest_id()
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    cur.execute(
-        "SELECT COUNT(*) FROM contest_entries WHERE contest_id = ?",
-        (contest_id,),
-    )
-    (count,) = cur.fetchone()
-    conn.close()
+    count = await adb(get_total_entries_for_current_contest, contest_id)
 
     if count == 0:
         await interaction.response.send_message(
@@ -1151,12 +1409,44 @@ async def opencontest(interaction: discord.Interaction):
         )
         return
 
-    set_contest_open(True)
+    await adb(set_contest_open, True)
     await interaction.response.send_message(
         "The contest has been re-opened. New entries are now accepted.",
         ephemeral=True,
     )
 
+# EntriesPageView adds Prev/Next buttons to /listentries, fetching one page of entries per click.
+class EntriesPageView(discord.ui.View):
+    def __init__(self, contest_id: int, total: int):
+        super().__init__(timeout=300)
+        self.contest_id = contest_id
+        # Counted once when /listentries runs, and reused for every page of this message
+        self.total = total
+        self.page = 0
+        self.page_count = (total + ENTRIES_PAGE_SIZE - 1) // ENTRIES_PAGE_SIZE
+
+    def render(self, rows: list[tuple[int, str]]) -> str:
+        """Format one page of entries and update the buttons to match."""
+        self.prev_button.disabled = self.page == 0
+        self.next_button.disabled = self.page >= self.page_count - 1
+        return (
+            f"**Current contest entries ({self.total}) – page {self.page + 1}/{self.page_count}:**\n"
+            + "\n".join(f"<@{user_id}>: {system_name}" for user_id, system_name in rows)
+        )
+
+    async def show_page(self, interaction: discord.Interaction, page: int):
+        self.page = page
+        rows = await adb(get_contest_entries, self.contest_id, page)
+        await interaction.response.edit_message(content=self.render(rows), view=self)
+
+    @discord.ui.button(label="◀ Prev", style=discord.ButtonStyle.secondary)
+    async def prev_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show_page(interaction, max(0, self.page - 1))
+
+    @discord.ui.button(label="Next ▶", style=discord.ButtonStyle.secondary)
+    async def next_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.show_page(interaction, min(self.page_count - 1, self.page + 1))
+
 # /listentries command to show all current entries (admin only)
 @bot.tree.command(
     name="listentries",
@@ -1177,28 +1467,22 @@ async def listentries(interaction: discord.Interaction):
         )
         return
 
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
     contest_id = get_current_contest_id()
-    cur.execute(
-        "SELECT user_id, system_name FROM contest_entries "
-        "WHERE contest_id = ? ORDER BY user_id",
-        (contest_id,),
-    )
-    rows = cur.fetchall()
-    conn.close()
+    total = await adb(get_total_entries_for_current_contest, contest_id)
 
-    if not rows:
+    if not total:
         await interaction.response.send_message(
             "There are currently no contest entries.",
             ephemeral=True,
         )
         return
 
-    lines = [f"<@{user_id}>: {system_name}" for user_id, system_name in rows]
-    message = "**Current contest entries:**\n" + "\n".join(lines)
+    view = EntriesPageView(contest_id, total)
+    rows = await adb(get_contest_entries, contest_id)
     await interaction.response.send_message(
-        message,
+        view.render(rows),
+        # Buttons are only needed when there is more than one page
+        view=view if view.page_count > 1 else discord.utils.MISSING,
         ephemeral=True,
     )
 
@@ -1208,32 +1492,22 @@ async def listentries(interaction: discord.Interaction):
 )
 async def conteststatus(interaction: discord.Interaction):
     contest_id = get_current_contest_id()
-    opened_at_raw = get_contest_open_date(contest_id)
-
-    # Format opened_at nicely with date + time
-    if opened_at_raw:
-        try:
-            opened_dt = datetime.fromisoformat(opened_at_raw)
-            opened_display = opened_dt.strftime("%Y-%m-%d %H:%M UTC")
-        except ValueError:
-            # Fallback for any older rows that only stored a date
-            opened_display = opened_at_raw
-    else:
-        opened_display = "Unknown"
+    # Already formatted with date + time when the contest was opened
+    opened_display = await adb(get_contest_open_date, contest_id) or "Unknown"
 
     # Get deadline and open/closed state
-    deadline_iso = get_entry_deadline()
+    deadline_ts = get_entry_deadline_ts()
     contest_open = is_contest_open()
     winner_picked = is_winner_picked()
     fob_system = get_fob_system()
-    total_entries = get_total_entries_for_current_contest()
+    total_entries = await adb(get_total_entries_for_current_contest, contest_id)
 
     # Build status lines
     lines: list[str] = []
 
     lines.append(f"Status for Contest #{contest_id} [{opened_display}]")
 
-    if not contest_open and deadline_iso:
+    if not contest_open and deadline_ts:
         # Contest closed because deadline passed
         lines.append("Entries are currently:")
         lines.append("DEADLINE PASSED - FOB system entries are CLOSED")
@@ -1245,9 +1519,7 @@ async def conteststatus(interaction: discord.Interaction):
         lines.append("CLOSED")
 
     # Deadline display
-    if deadline_iso:
-        deadline_dt = datetime.fromisoformat(deadline_iso)
-        deadline_ts = int(deadline_dt.timestamp())
+    if deadline_ts:
         rel = f"<t:{deadline_ts}:R>"
         lines.append(f"Entry deadline: <t:{deadline_ts}:F> ({rel})")
     else:
@@ -1264,7 +1536,7 @@ async def conteststatus(interaction: discord.Interaction):
 
     if winner_picked:
         # You likely store winner info in contests table; fetch it here
-        winner_user_id, winner_system = get_current_winner_info()
+        winner_user_id, winner_system = await adb(get_current_winner_info, contest_id)
         if winner_user_id is not None:
             lines.append(
                 f"Contest Winner is: <@{winner_user_id}> "
@@ -1291,18 +1563,18 @@ class DeadlineModal(discord.ui.Modal, title='Set Contest Deadline'):
         min_length=16,
     )
     
-    def __init__(self, new_contest_id: int, opened_at: str, channel_id: int):
+    def __init__(self, new_contest_id: int, opened_display: str, channel_id: int):
         super().__init__()
         self.new_contest_id = new_contest_id
-        self.opened_at = opened_at
+        self.opened_display = opened_display
         self.channel_id = channel_id
     
     async def on_submit(self, interaction: discord.Interaction):
+        global _last_countdown_sig
         try:
             # Parse the datetime
-            deadline_dt = datetime.strptime(self.deadline_input.value, "%Y-%m-%d %H:%M")
-            deadline_dt = deadline_dt.replace(tzinfo=UTC)
-            deadline_iso = deadline_dt.isoformat()
+            deadline_dt = parse_deadline_input(self.deadline_input.value)
+            deadline_ts = int(deadline_dt.timestamp())
             
             # Validate deadline is in the future
             now = datetime.now(UTC)
@@ -1313,40 +1585,45 @@ class DeadlineModal(discord.ui.Modal, title='Set Contest Deadline'):
                 )
                 return
             
-            # Store the deadline
-            set_entry_deadline(deadline_iso)
+            # Remember where the previous countdown lives before moving it to this channel
+            message_id = get_countdown_message_id()
+            previous_channel_id = get_countdown_channel_id() or CHANNEL_ID
             
-            # Set the countdown channel to the channel where command was run
-            set_countdown_channel_id(self.channel_id)
+            # Store the deadline, and set the countdown channel to the channel where command was run
+            await adb(set_deadline_and_channel, deadline_ts, self.channel_id)
 
-            # Clear previous countdown message if it exists
-            message_id = get_countdown_message_id()
+            # Reuse the previous countdown message if it exists
             if message_id:
-                channel_id = get_countdown_channel_id()
-                if channel_id:
-                    try:
-                        channel = bot.get_channel(channel_id)
+                edited = False
+                try:
+                    if previous_channel_id == self.channel_id:
+                        channel = bot.get_channel(previous_channel_id)
                         if channel:
+                            # Same channel: edit it in place for the new contest (same message ID)
                             message = await channel.fetch_message(message_id)
-                            await message.delete()
-                    except discord.HTTPException as e:
-                        log.warning("Failed to delete previous countdown message %s: %s", message_id, e)
-                set_countdown_message_id(None)
-
-            # Trigger immediate countdown update so the public embed appears/updates
-            if update_countdown.is_running():
-                update_countdown.restart()
-            
-            # Format for display
-            discord_timestamp = int(deadline_dt.timestamp())
-            
+                            embed, sig = build_countdown_embed(self.new_contest_id, deadline_dt, now)
+                            await message.edit(embed=embed)
+                            _last_countdown_sig = (message.id, sig)
+                            edited = True
+                    elif previous_channel_id:
+                        # The countdown is moving to another channel, so delete the old one by ID (no fetch needed)
+                        await bot.http.delete_message(previous_channel_id, message_id)
+                except discord.HTTPException as e:
+                    log.warning("Failed to update previous countdown message %s: %s", message_id, e)
+                if not edited:
+                    # The countdown task will post a fresh message
+                    await adb(set_countdown_message_id, None)
+
             await interaction.response.send_message(
-                f"✅ New contest started: **Contest #{self.new_contest_id} [{self.opened_at}]**\n"
-                f"📅 Entry deadline set to: <t:{discord_timestamp}:F> (<t:{discord_timestamp}:R>)\n"
+                f"✅ New contest started: **Contest #{self.new_contest_id} [{self.opened_display}]**\n"
+                f"📅 Entry deadline set to: <t:{deadline_ts}:F> (<t:{deadline_ts}:R>)\n"
                 f"⏰ Countdown will be posted in <#{self.channel_id}>.\n"
                 f"FOB system reset and entries are now OPEN.",
                 ephemeral=True,
             )
+
+            # Wake the countdown loop so it refreshes now instead of after its idle wait
+            _countdown_wake.set()
             
         except ValueError:
             await interaction.response.send_message(
@@ -1370,71 +1647,20 @@ async def newcontest(interaction: discord.Interaction):
         )
         return
 
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    
     try:
-        # Close the current contest
-        cur.execute(
-            "INSERT INTO settings(key, value) VALUES(?, ?) "
-            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-            ("contest_open", "0"),
-        )
+        new_contest_id, opened_display = await adb(start_new_contest)
 
-        # Insert a new contest row with today's date (UTC)
-        opened_at = datetime.now(UTC).isoformat()
-        cur.execute(
-            "INSERT INTO contests(opened_at) VALUES(?)",
-            (opened_at,),
-        )
-        new_contest_id = cur.lastrowid
-
-        # Clear FOB system for the new contest (settings is global)
-        cur.execute(
-            "INSERT INTO settings(key, value) VALUES(?, ?) "
-            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-            ("fob_system", ""),
-        )
-        cur.execute("DELETE FROM settings WHERE key = ?", ("entry_deadline",))
-        # Clear countdown message tracking
-        cur.execute("DELETE FROM settings WHERE key = ?", ("countdown_message_id",))
-        cur.execute("DELETE FROM settings WHERE key = ?", ("countdown_channel_id",))
-
-        # Update current_contest_id and reopen entries
-        cur.execute(
-            "INSERT INTO settings(key, value) VALUES(?, ?) "
-            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-            ("current_contest_id", str(new_contest_id)),
-        )
-        cur.execute(
-            "INSERT INTO settings(key, value) VALUES(?, ?) "
-            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-            ("contest_open", "1"),
-        )
-
-        # Reset winner-picked flag for the new contest
-        cur.execute(
-            "INSERT INTO settings(key, value) VALUES(?, ?) "
-            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-            (WINNER_PICKED_KEY, "0"),
-        )
-
-        conn.commit()
-        
         # Show modal to set deadline
-        modal = DeadlineModal(new_contest_id, opened_at, interaction.channel_id)
+        modal = DeadlineModal(new_contest_id, opened_display, interaction.channel_id)
         await interaction.response.send_modal(modal)
         
     except sqlite3.Error as e:
-        conn.rollback()
         log.exception("Error while starting new contest: %s", e)
         await interaction.response.send_message(
             "Failed to start a new contest due to a database error.",
             ephemeral=True,
         )
         return
-    finally:
-        conn.close()
 
 # /backupdb command to create a timestamped backup of the database (admin only)
 @bot.tree.command(
@@ -1467,7 +1693,7 @@ async def backupdb(interaction: discord.Interaction):
         backup_name = f"contest-{ts}.db"
         backup_path = os.path.join(os.path.dirname(DB_PATH), backup_name)
 
-        shutil.copy2(DB_PATH, backup_path)
+        await adb(backup_database, backup_path)
         log.info("Database backed up to %s", backup_path)
 
         # Send the real result message
@@ -1489,7 +1715,7 @@ async def backupdb(interaction: discord.Interaction):
 )
 async def myguess(interaction: discord.Interaction):
     user_id = interaction.user.id
-    system = get_user_entry(user_id)
+    system = await adb(get_user_entry, user_id)
 
     if system is None:
         await interaction.response.send_message(
@@ -1509,24 +1735,14 @@ async def myguess(interaction: discord.Interaction):
     name="contesthistory",
     description="Show history of all contests, including no-winner contests.",
 )
-async def contesthistory(interaction: discord.Interaction):
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-
-    # Get all contests, regardless of whether they have a winner
-    cur.execute(
-        """
-        SELECT c.id, c.opened_at, c.winner_user_id, c.winner_system 
-        FROM contests c
-        ORDER BY c.id DESC
-        """
-    )
-    rows = cur.fetchall()
-    conn.close()
+@app_commands.describe(page=f"Page of results to show ({HISTORY_PAGE_SIZE} contests per page, newest first).")
+async def contesthistory(interaction: discord.Interaction, page: app_commands.Range[int, 1] = 1):
+    # Get one page of contests, regardless of whether they have a winner
+    rows = await adb(get_contest_history, page)
 
     if not rows:
         await interaction.response.send_message(
-            "No contests have been recorded yet.",
+            "No contests have been recorded yet." if page == 1 else f"There is no page {page} of contest history.",
             ephemeral=True,
         )
         return
@@ -1537,18 +1753,14 @@ async def contesthistory(interaction: discord.Interaction):
         color=0x00BFFF,  # Blue-ish
     )
 
-    for contest_id, opened_at, winner_user_id, winner_system in rows:
-        try:
-            opened_dt = datetime.fromisoformat(opened_at)
-            opened_display = opened_dt.strftime("%Y-%m-%d %H:%M UTC")
-        except ValueError:
-            opened_display = opened_at
+    embed.set_footer(text=f"Page {page}")
 
+    for contest_id, opened_display, winner_user_id, winner_system in rows:
         # Human-readable status line
         if winner_user_id is None:
             value = (
                 "Status: ❌ No winner (no correct guesses)\n"
-                f"Opened at: `{opened_at}`"
+                f"Opened at: `{opened_display}`"
             )
         else:
             value = (
@@ -1572,20 +1784,8 @@ async def contesthistory(interaction: discord.Interaction):
     description="Show previous contest winners.",
 )
 async def pastwinners(interaction: discord.Interaction):
-    conn = sqlite3.connect(DB_PATH)
-    cur = conn.cursor()
-    
     # Get all contests that have winners
-    cur.execute(
-        """
-        SELECT c.id, c.opened_at, c.winner_user_id, c.winner_system 
-        FROM contests c
-        WHERE c.winner_user_id IS NOT NULL
-        ORDER BY c.id DESC
-        """
-    )
-    rows = cur.fetchall()
-    conn.close()
+    rows = await adb(get_past_winners)
     
     if not rows:
         await interaction.response.send_message(
@@ -1594,25 +1794,17 @@ async def pastwinners(interaction: discord.Interaction):
         )
         return
     
+    # Every winner has the same layout, so build one description instead of a field per contest
     embed = discord.Embed(
         title="🏆 Past Contest Winners",
-        description="History of Guristas FOB Contest winners",
+        description="History of Guristas FOB Contest winners\n\n" + "\n\n".join(
+            f"**Contest #{contest_id} ({opened_display})**\n"
+            f"Winner: <@{winner_user_id}>\nSystem: **{winner_system}**"
+            for contest_id, opened_display, winner_user_id, winner_system in rows
+        ),
         color=0xFFD700,  # Gold color
     )
-    
-    for contest_id, opened_at, winner_user_id, winner_system in rows:
-        try:
-            opened_dt = datetime.fromisoformat(opened_at)
-            opened_display = opened_dt.strftime("%Y-%m-%d %H:%M UTC")
-        except ValueError:
-            opened_display = opened_at
 
-        embed.add_field(
-            name=f"Contest #{contest_id} ({opened_display})",
-            value=f"Winner: <@{winner_user_id}>\nSystem: **{winner_system}**",
-            inline=False,
-        )
-  
     await interaction.response.send_message(embed=embed, ephemeral=True)
 
 # /enter command for users to submit their system guess for the contest
@@ -1647,10 +1839,8 @@ async def enter(interaction: discord.Interaction, system: str):
 
     # 2) Check if past deadline
     if is_past_deadline():
-        deadline = get_entry_deadline()
-        if deadline:
-            deadline_dt = datetime.fromisoformat(deadline)
-            discord_timestamp = int(deadline_dt.timestamp())
+        discord_timestamp = get_entry_deadline_ts()
+        if discord_timestamp is not None:
             await interaction.response.send_message(
                 f"Entry deadline has passed (<t:{discord_timestamp}:R>). "
                 "No more entries are being accepted.",
@@ -1665,7 +1855,7 @@ async def enter(interaction: discord.Interaction, system: str):
         return
 
     # 3) Check if THIS USER already has an entry in THIS contest
-    previous = get_user_entry(user_id)
+    previous, taken = await adb(check_entry_conflicts, user_id, system_norm)
     if previous is not None:
         # At this point, previous really means "you already had an entry BEFORE this command"
         await interaction.response.send_message(
@@ -1676,7 +1866,7 @@ async def enter(interaction: discord.Interaction, system: str):
         return
 
     # 4) Check if THIS SYSTEM is already taken by someone else in THIS contest
-    if is_system_taken(system_norm):
+    if taken:
         await interaction.response.send_message(
             f"The system **{system_norm}** has already been picked by another pilot.\n"
             "Please choose a different system.",
@@ -1684,8 +1874,23 @@ async def enter(interaction: discord.Interaction, system: str):
         )
         return
 
-    # 5) All checks passed → store the user's entry now
-    set_user_entry(user_id, system_norm)
+    # 5) All checks passed → store the user's entry now. The insert is atomic, so if a
+    #    concurrent /enter got there first (same user or same system) nothing is written.
+    if not await adb(add_user_entry, user_id, system_norm):
+        previous = await adb(get_user_entry, user_id)
+        if previous is not None:
+            await interaction.response.send_message(
+                f"You already entered the contest with the system: **{previous}**.\n"
+                "Only one entry per person is allowed.",
+                ephemeral=True,
+            )
+        else:
+            await interaction.response.send_message(
+                f"The system **{system_norm}** has already been picked by another pilot.\n"
+                "Please choose a different system.",
+                ephemeral=True,
+            )
+        return
 
     # 6) Success message
     await interaction.response.send_message(
@@ -1695,58 +1900,56 @@ async def enter(interaction: discord.Interaction, system: str):
     )
 
 
+# The /helpcontest embed never changes, so it is built once at startup and reused
+_HELPCONTEST_EMBED = discord.Embed(
+    title="FOB Contest Bot Commands",
+    description="Commands for the Guristas FOB Contest",
+    color=0x00FFAA,
+)
+
+# User commands
+_HELPCONTEST_EMBED.add_field(
+    name="📝 User Commands",
+    value=(
+        "`/allowedsystems` – Show the list of allowed FOB systems\n"
+        "`/contesthistory` – Show history of all contests (25 per page)\n"
+        "`/enter` – Enter the contest with your system guess\n"
+        "`/myguess` – Show your current entry\n"
+        "`/pastwinners` – Show previous contest winners\n"
+        "`/prizes` – Show prize information\n"
+        "`/rules` – Show contest rules\n"
+        "`/utcnow` – Show current UTC time and example timestamps\n"
+    ),
+    inline=False,
+)
+
+# Admin commands
+_HELPCONTEST_EMBED.add_field(
+    name="⚙️ Admin Commands",
+    value=(
+        "`/backupdb` – Back up the database\n"
+        "`/cleardeadline` – Remove entry deadline\n"
+        "`/conteststatus` – Show current contest status\n"
+        "`/endcontest` – Close entries and pick winner\n"
+        "`/listentries` – List all entries\n"
+        "`/newcontest` – Start a new contest\n"
+        "`/opencontest` – Re-open entries\n"
+        "`/setdeadline` – Set entry deadline (US Central CST/CDT → UTC)\n"
+        "`/setprizes` – Set the ordered prize list (1–4 prizes)\n"
+    ),
+    inline=False,
+)
+
+_HELPCONTEST_EMBED.set_footer(text="Use /helpcontest anytime to see this list")
+
 # /helpcontest command to show all available commands and their descriptions
 @bot.tree.command(
     name="helpcontest",
     description="Show all FOB contest bot commands.",
 )
 async def helpcontest(interaction: discord.Interaction):
-    # Defer immediately to prevent timeout issues
-    await interaction.response.defer(ephemeral=True)
-    
-    embed = discord.Embed(
-        title="FOB Contest Bot Commands",
-        description="Commands for the Guristas FOB Contest",
-        color=0x00FFAA,
-    )
-    
-    # User commands
-    embed.add_field(
-        name="📝 User Commands",
-        value=(
-            "`/allowedsystems` – Show the list of allowed FOB systems\n"
-            "`/contesthistory` – Show history of all contests\n"
-            "`/enter` – Enter the contest with your system guess\n"
-            "`/myguess` – Show your current entry\n"
-            "`/pastwinners` – Show previous contest winners\n"
-            "`/prizes` – Show prize information\n"
-            "`/rules` – Show contest rules\n"
-            "`/utcnow` – Show current UTC time and example timestamps\n"
-        ),
-        inline=False,
-    )
-    
-    # Admin commands
-    embed.add_field(
-        name="⚙️ Admin Commands",
-        value=(
-            "`/backupdb` – Back up the database\n"
-            "`/cleardeadline` – Remove entry deadline\n"
-            "`/conteststatus` – Show current contest status\n"
-            "`/endcontest` – Close entries and pick winner\n"
-            "`/listentries` – List all entries\n"
-            "`/newcontest` – Start a new contest\n"
-            "`/opencontest` – Re-open entries\n"
-            "`/setdeadline` – Set entry deadline (CST → UTC)\n"
-            "`/setprizes` – Set the ordered prize list (1–4 prizes)\n"
-        ),
-        inline=False,
-    )
-    
-    embed.set_footer(text="Use /helpcontest anytime to see this list")
-    
-    # Use followup instead of response since we deferred
-    await interaction.followup.send(embed=embed, ephemeral=True)
+    # The embed is prebuilt, so answer directly without a defer/followup round trip
+    await interaction.response.send_message(embed=_HELPCONTEST_EMBED, ephemeral=True)
 
 # /setdeadline command for admins to set the entry deadline for the contest
 @bot.tree.command(
@@ -1754,11 +1957,16 @@ async def helpcontest(interaction: discord.Interaction):
     description="Set entry deadline (format YYYY-MM-DD HH:MM) (admins only).",
 )
 @app_commands.describe(
-    datetime_local="Deadline in your local time (CST, YYYY-MM-DD HH:MM), e.g., 2026-02-16 08:30"
+    datetime_local="Deadline in US Central time (CST/CDT, YYYY-MM-DD HH:MM), e.g., 2026-02-16 08:30"
 )
 async def setdeadline(interaction: discord.Interaction, datetime_local: str):
+    # Acknowledge first so the checks and DB writes below can't outrun Discord's 3-second window
+    await interaction.response.defer(ephemeral=True)
+    # Interaction.followup builds a new Webhook on every access, so fetch it once
+    followup = interaction.followup
+
     if not is_contest_admin(interaction):
-        await interaction.response.send_message(
+        await followup.send(
             "You do not have permission to set entry deadline.",
             ephemeral=True,
         )
@@ -1766,44 +1974,55 @@ async def setdeadline(interaction: discord.Interaction, datetime_local: str):
 
     # Check if winner has been picked
     if is_winner_picked():
-        await interaction.response.send_message(
+        await followup.send(
             "Cannot set deadline - winner has already been picked for this contest.\n"
             "Use `/newcontest` to start a new contest.",
             ephemeral=True,
         )
         return
 
-    try:
-        from datetime import timedelta
+    # Parse the datetime (fromisoformat accepts the space separator) as US Central time.
+    # The shape is checked first; fromisoformat then only rejects out-of-range values like month 13.
+    datetime_local = datetime_local.strip()
+    deadline_local = None
+    if _DEADLINE_RE.fullmatch(datetime_local):
+        try:
+            deadline_local = datetime.fromisoformat(datetime_local)
+        except ValueError:
+            pass  # Right shape, but not a real date/time
+    if deadline_local is None:
+        await followup.send(
+            "Invalid datetime format. Use: YYYY-MM-DD HH:MM (e.g., 2026-02-16 14:30)",
+            ephemeral=True,
+        )
+        return
 
-        # Parse the datetime as CST
-        deadline_local = datetime.strptime(datetime_local, "%Y-%m-%d %H:%M")
+    # Convert to UTC (honours CST/CDT)
+    deadline_dt = deadline_local.replace(tzinfo=CENTRAL_TZ).astimezone(UTC)
+    deadline_ts = int(deadline_dt.timestamp())
 
-        # Convert CST to UTC (add 6 hours)
-        deadline_dt = deadline_local + timedelta(hours=6)
-        deadline_dt = deadline_dt.replace(tzinfo=UTC)
-        deadline_iso = deadline_dt.isoformat()
+    await adb(set_deadline_and_channel, deadline_ts, interaction.channel_id)
 
-        set_entry_deadline(deadline_iso)
-        set_countdown_channel_id(interaction.channel_id)
+    await followup.send(
+        f"Entry deadline set to: <t:{deadline_ts}:F> (<t:{deadline_ts}:R>)\n"
+        f"Countdown will be posted in this channel.",
+        ephemeral=True,
+    )
 
-        # Format for display
-        discord_timestamp = int(deadline_dt.timestamp())
-        await interaction.response.send_message(
-            f"Entry deadline set to: <t:{discord_timestamp}:F> (<t:{discord_timestamp}:R>)\n"
-            f"Countdown will be posted in this channel.",
-            ephemeral=True,
-        )
+    # Wake the countdown loop so it refreshes now and recomputes its interval
+    _countdown_wake.set()
 
-        # Trigger immediate countdown update
-        if update_countdown.is_running():
-            update_countdown.restart()
 
-    except ValueError:
-        await interaction.response.send_message(
-            "Invalid datetime format. Use: YYYY-MM-DD HH:MM (e.g., 2026-02-16 14:30)",
-            ephemeral=True,
-        )
+# delete_countdown_message removes the public countdown message and forgets its ID. Both IDs are known, so it deletes by ID instead of fetching the message first.
+async def delete_countdown_message(channel_id: int | None, message_id: int):
+    if channel_id:
+        try:
+            await bot.http.delete_message(channel_id, message_id)
+        except discord.NotFound:
+            pass  # Already gone
+        except discord.HTTPException as e:
+            log.warning("Failed to delete countdown message %s: %s", message_id, e)
+    await adb(set_countdown_message_id, None)
 
 
 # /cleardeadline command for admins to clear the entry deadline and allow entries until the contest is closed
@@ -1812,44 +2031,48 @@ async def setdeadline(interaction: discord.Interaction, datetime_local: str):
     description="Remove entry deadline (admins only).",
 )
 async def cleardeadline(interaction: discord.Interaction):
+    # Defer up front: deleting the countdown message below is a Discord round trip of its own
+    await interaction.response.defer(ephemeral=True)
+    followup = interaction.followup
+
     if not is_contest_admin(interaction):
-        await interaction.response.send_message(
+        await followup.send(
             "You do not have permission to clear entry deadline.",
             ephemeral=True,
         )
         return
     
-    set_entry_deadline(None)
+    await adb(set_entry_deadline, None)
     
-    # Remove countdown message
-    message_id = get_countdown_message_id()
-    if message_id:
-        channel_id = get_countdown_channel_id()
-        if channel_id:
-            try:
-                channel = bot.get_channel(channel_id)
-                if channel:
-                    message = await channel.fetch_message(message_id)
-                    await message.delete()
-            except discord.HTTPException as e:
-                log.warning("Failed to delete countdown message %s: %s", message_id, e)
-        set_countdown_message_id(None)
-    
-    await interaction.response.send_message(
+    reply = followup.send(
         "Entry deadline has been cleared. Entries accepted until contest closes.",
         ephemeral=True,
     )
+    message_id = get_countdown_message_id()
+    if message_id:
+        # Remove the countdown message while the confirmation is being sent; neither depends on the other
+        await asyncio.gather(
+            delete_countdown_message(get_countdown_channel_id() or CHANNEL_ID, message_id),
+            reply,
+        )
+    else:
+        await reply
 
 @bot.tree.command(
     name="utcnow",
     description="Show current UTC time and a sample Discord timestamp.",
 )
 async def utcnow(interaction: discord.Interaction):
-    now_utc = datetime.now(UTC)
-    discord_timestamp = int(now_utc.timestamp())
+    # Read the clock once and derive both the epoch seconds and the datetime from it
+    now_ts = time.time()
+    now_utc = datetime.fromtimestamp(now_ts, UTC)
+    discord_timestamp = int(now_ts)
 
     # Human-readable UTC string
-    utc_str = now_utc.strftime("%Y-%m-%d %H:%M:%S UTC")
+    utc_str = (
+        f"{now_utc.year:04d}-{now_utc.month:02d}-{now_utc.day:02d} "
+        f"{now_utc.hour:02d}:{now_utc.minute:02d}:{now_utc.second:02d} UTC"
+    )
 
     await interaction.response.send_message(
         "Current UTC time:\n"
@@ -1865,5 +2088,23 @@ if not TOKEN:
     log.error("DISCORD_BOT_TOKEN environment variable is not set.")
     raise RuntimeError("Please set the DISCORD_BOT_TOKEN environment variable before running the bot.")
 
+# uvloop is optional (not available on Windows); its event loop has less per-event overhead than asyncio's default
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 log.info("Running bot...")
-bot.run(TOKEN)
\ No newline at end of file
+if uvloop is not None:
+    async def main():
+        async with bot:
+            await bot.start(TOKEN)
+
+    log.info("Using uvloop event loop")
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        try:
+            runner.run(main())
+        except KeyboardInterrupt:
+            pass  # Ctrl+C: the bot was closed on the way out of main()
+else:
+    bot.run(TOKEN)
\ No newline at end of file